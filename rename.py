@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
 
 import os
+import re
 import sys
+import mmap
+import errno
+import ctypes
 import shutil
 import argparse
-from concurrent.futures import ThreadPoolExecutor, Future
-from typing import List, Tuple, Set, Dict, Callable, Optional, Any, Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor, Future, FIRST_COMPLETED, wait
+from typing import List, Tuple, Set, Dict, Callable, Optional, Any, Iterator, Iterable
 import fnmatch
+import multiprocessing
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack
 from functools import partial
+from itertools import islice
 
 from rich.console import Console
 from rich.logging import RichHandler
@@ -20,9 +28,17 @@ import rich_argparse
 
 # --- Configuration ---
 PLACEHOLDER: str = "PROJECT"  # The exact string to find and replace
+PLACEHOLDER_BYTES: bytes = PLACEHOLDER.encode('utf-8')  # Encoded once for byte-level content matching
 DEFAULT_IGNORE_DIRS: Set[str] = {'.git', '.svn', '.hg', '__pycache__', 'node_modules', 'venv', '.venv'}
 DEFAULT_IGNORE_FILES: Set[str] = {'*.pyc', '*.pyo', '*.so', '*.dll', '*.exe', '*.bin', '*.jpg', '*.png', '*.gif'}
 DEFAULT_MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
+CHUNK_SIZE: int = 64  # Number of files handed to a worker at once
+MAX_PENDING_CHUNKS_PER_WORKER: int = 4  # Bounds how far the tree walk runs ahead of the workers
+LARGE_FILE_SIZE: int = 1024 * 1024  # 1MB; larger files are processed in a separate process
+PROGRESS_UPDATE_INTERVAL: int = 64  # Files checked between progress and log flushes in dry runs
+
+FileEntry = Tuple[str, int]  # (file path, size in bytes) as recorded by iter_files
+UNKNOWN_FILE_SIZE: int = -1  # Size recorded for files that could not be stat'ed
 
 # Set up rich console and logging
 console: Console = Console()
@@ -34,117 +50,253 @@ logging.basicConfig(
 )
 log = logging.getLogger("project_renamer")
 
-def is_binary_file(file_path: str, sample_size: int = 8000) -> bool:
+# renameat2(2) flags, used for atomic no-overwrite renames on Linux
+AT_FDCWD: int = -100
+RENAME_NOREPLACE: int = 1
+
+def load_renameat2() -> Optional[Callable[..., int]]:
+    """
+    Look up libc's renameat2 function.
+    
+    Returns
+    -------
+    Optional[Callable[..., int]]
+        The ctypes wrapper for renameat2, or None if it is unavailable
+        (non-Linux platforms or glibc older than 2.28)
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return None
+    
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    renameat2.restype = ctypes.c_int
+    return renameat2
+
+renameat2 = load_renameat2()
+
+def scan_file(
+    file_path: str,
+    file_size: int,
+    placeholder: bytes,
+    max_size: int,
+    keep_content: bool = False,
+    offsets: Optional[List[int]] = None,
+    sample_size: int = 8000
+) -> Tuple[Optional[str], bool, Optional[bytes]]:
     """
-    Check if a file is binary by reading a sample.
+    Classify a file and search it for the placeholder using a single open.
     
     Parameters
     ----------
     file_path : str
-        Path to the file to check
+        Path to the file to scan
+    file_size : int
+        Size of the file in bytes, as recorded when the tree was scanned, or
+        UNKNOWN_FILE_SIZE if it could not be stat'ed
+    placeholder : bytes
+        The encoded placeholder to search for
+    max_size : int
+        Maximum file size in bytes to process
+    keep_content : bool, optional
+        If True, return the file content when the placeholder is found, by default False
+    offsets : Optional[List[int]], optional
+        If given, the byte offset of every non-overlapping occurrence of the
+        placeholder is appended to this list, by default None
     sample_size : int, optional
-        Number of bytes to read for sampling, by default 8000
+        Number of leading bytes sampled for binary detection, by default 8000
     
     Returns
     -------
-    bool
-        True if the file appears to be binary, False otherwise
+    Tuple[Optional[str], bool, Optional[bytes]]
+        A tuple containing:
+        - Reason the file should be skipped ("too large", "binary", "unreadable"), or None
+        - Boolean indicating whether the placeholder occurs in the file
+        - The file content if requested and the placeholder was found, None otherwise
     
     Notes
     -----
-    This function uses two heuristics to detect binary files:
-    1. Presence of null bytes
-    2. Failure to decode as UTF-8
+    The file is memory-mapped read-only so the null-byte check and the
+    placeholder search both run as C-level ``find`` calls over the page cache,
+    without decoding or copying the content. Only when the placeholder is found
+    and ``keep_content`` is set is the mapping copied out, so callers never
+    need to reopen the file to read it. Callers that only need to know where
+    the placeholder occurs can collect ``offsets`` instead, which avoids the
+    copy entirely. A file is treated as binary if its
+    leading sample contains null bytes; text in any ASCII-compatible encoding
+    is accepted since replacement happens on the raw bytes.
+    
+    The size comes from the directory scan, so files that are too large, or
+    too small to contain the placeholder, are classified without being opened
+    or stat'ed again. Files that could not be stat'ed are unreadable.
     """
+    if file_size == UNKNOWN_FILE_SIZE:
+        return "unreadable", False, None
+    if file_size > max_size:
+        return "too large", False, None
+    if file_size < len(placeholder):
+        return None, False, None
+    
     try:
-        if os.path.getsize(file_path) == 0:
-            return False
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return "unreadable", False, None
+    
+    try:
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            # Files with null bytes are likely binary
+            if mm.find(b'\x00', 0, min(sample_size, file_size)) != -1:
+                return "binary", False, None
             
-        with open(file_path, 'rb') as f:
-            sample = f.read(sample_size)
+            offset = mm.find(placeholder)
+            if offset == -1:
+                return None, False, None
             
-        # Files with null bytes are likely binary
-        if b'\x00' in sample:
-            return True
+            if offsets is not None:
+                while offset != -1:
+                    offsets.append(offset)
+                    offset = mm.find(placeholder, offset + len(placeholder))
             
-        # Try to decode as text
-        try:
-            sample.decode('utf-8')
-            return False
-        except UnicodeDecodeError:
-            return True
-    except (IOError, OSError):
-        return True  # If we can't open/read the file, treat as binary to be safe
+            return None, True, mm[:] if keep_content else None
+    except ValueError:
+        return None, False, None  # The file was emptied since it was scanned
+    except OSError:
+        return "unreadable", False, None
+    finally:
+        os.close(fd)
 
-def matches_any_pattern(name: str, patterns: Set[str]) -> bool:
+def compile_patterns(patterns: Set[str]) -> re.Pattern[str]:
     """
-    Check if a name matches any of the given patterns.
+    Compile a set of glob patterns into a single regular expression.
     
     Parameters
     ----------
-    name : str
-        The name to check against patterns
     patterns : Set[str]
-        Set of glob patterns to match against
+        Set of glob patterns to combine
     
     Returns
     -------
-    bool
-        True if the name matches any pattern, False otherwise
+    re.Pattern[str]
+        Compiled pattern whose ``match`` is true if a name matches any of the globs
+    
+    Notes
+    -----
+    ``fnmatch.fnmatch`` translates and looks up its pattern on every call; joining
+    the translated globs once lets each check run as a single regex match. Like
+    ``fnmatch.fnmatch``, matching is case-insensitive on case-insensitive platforms.
     """
-    return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+    if not patterns:
+        return re.compile(r'(?!)')  # An empty alternation would match everything
+    
+    flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+    return re.compile('|'.join(fnmatch.translate(pattern) for pattern in sorted(patterns)), flags)
 
-def should_ignore_path(path: str, ignore_dirs: Set[str], ignore_files: Set[str]) -> bool:
+def should_ignore_path(name: str, is_dir: bool, ignore_dirs: re.Pattern[str], ignore_files: re.Pattern[str]) -> bool:
     """
-    Check if a path should be ignored based on configured patterns.
+    Check if a directory entry should be ignored based on configured patterns.
     
     Parameters
     ----------
-    path : str
-        The file or directory path to check
-    ignore_dirs : Set[str]
-        Set of directory patterns to ignore
-    ignore_files : Set[str]
-        Set of file patterns to ignore
+    name : str
+        The base name of the file or directory to check
+    is_dir : bool
+        Whether the entry is a directory
+    ignore_dirs : re.Pattern[str]
+        Compiled directory patterns to ignore, see compile_patterns
+    ignore_files : re.Pattern[str]
+        Compiled file patterns to ignore, see compile_patterns
     
     Returns
     -------
     bool
-        True if the path should be ignored, False otherwise
-    """
-    path_parts = path.split(os.sep)
+        True if the entry should be ignored, False otherwise
     
-    # Check if any part of the path matches ignored directories
-    if any(matches_any_pattern(part, ignore_dirs) for part in path_parts):
+    Notes
+    -----
+    Only the base name is checked: the walker never descends into an ignored
+    directory, so no ancestor of an entry it yields can match.
+    """
+    # Directory patterns also apply to files (e.g. a '.git' file in a worktree)
+    if ignore_dirs.match(name):
         return True
     
-    # Check if filename matches ignored files
-    if os.path.isfile(path) and matches_any_pattern(os.path.basename(path), ignore_files):
-        return True
+    return not is_dir and ignore_files.match(name) is not None
+
+def rename_noreplace(src: str, dst: str) -> None:
+    """
+    Rename a path, failing instead of overwriting an existing target.
+    
+    Parameters
+    ----------
+    src : str
+        Path to rename
+    dst : str
+        Destination path
+    
+    Raises
+    ------
+    FileExistsError
+        If the destination already exists
+    OSError
+        If the path could not be renamed
+    
+    Notes
+    -----
+    On Linux this is a single atomic ``renameat2(RENAME_NOREPLACE)`` call. If that
+    is unavailable, or the filesystem does not support the flag, the target is
+    checked before a plain ``os.rename``; Windows' rename never overwrites, so
+    the check is skipped there.
+    """
+    if renameat2 is not None:
+        if renameat2(AT_FDCWD, os.fsencode(src), AT_FDCWD, os.fsencode(dst), RENAME_NOREPLACE) == 0:
+            return
         
-    return False
+        err = ctypes.get_errno()
+        if err not in (errno.EINVAL, errno.ENOSYS):
+            raise OSError(err, os.strerror(err), src, None, dst)
+    
+    if os.name != 'nt' and os.path.lexists(dst):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), src, None, dst)
+    
+    os.rename(src, dst)
 
-def read_file_content(file_path: str) -> Optional[str]:
+def move_path(src: str, dst: str) -> None:
     """
-    Read and return file content, or None if file can't be read.
+    Move a file or directory without overwriting, using a plain rename when possible.
     
     Parameters
     ----------
-    file_path : str
-        Path to the file to read
+    src : str
+        Path to move
+    dst : str
+        Destination path
+    
+    Raises
+    ------
+    FileExistsError
+        If the destination already exists
+    OSError
+        If the path could not be moved
     
-    Returns
-    -------
-    Optional[str]
-        File content as string if successful, None otherwise
+    Notes
+    -----
+    Renames within the project tree are almost always on the same filesystem,
+    where a rename is a single syscall. ``shutil.move`` (with its extra stats
+    and copy fallback) is only used if the rename crosses devices.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            return f.read()
-    except Exception:
-        return None
+        rename_noreplace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        if os.path.lexists(dst):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), src, None, dst) from e
+        shutil.move(src, dst)
 
-def write_file_content(file_path: str, content: str) -> bool:
+def write_file_content(file_path: str, content: bytes) -> bool:
     """
     Write content to file, return success status.
     
@@ -152,7 +304,7 @@ def write_file_content(file_path: str, content: str) -> bool:
     ----------
     file_path : str
         Path to the file to write
-    content : str
+    content : bytes
         Content to write to the file
     
     Returns
@@ -161,47 +313,92 @@ def write_file_content(file_path: str, content: str) -> bool:
         True if write was successful, False otherwise
     """
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
+        with open(file_path, 'wb') as f:
             f.write(content)
         return True
     except Exception:
         return False
 
-def replace_content(content: str, placeholder: str, replacement: str) -> Tuple[str, bool]:
+def patch_file_content(file_path: str, offsets: List[int], replacement: bytes) -> bool:
+    """
+    Overwrite each occurrence of the placeholder in place, return success status.
+    
+    Parameters
+    ----------
+    file_path : str
+        Path to the file to patch
+    offsets : List[int]
+        Byte offsets of the placeholder occurrences, as collected by scan_file
+    replacement : bytes
+        The encoded replacement; must be the same length as the placeholder
+    
+    Returns
+    -------
+    bool
+        True if all occurrences were overwritten, False otherwise
+    
+    Notes
+    -----
+    When the replacement has the same length as the placeholder, only the
+    matched bytes need writing: the file is neither truncated nor rewritten.
+    Requires ``os.pwrite``, which is unavailable on Windows.
+    """
+    try:
+        fd = os.open(file_path, os.O_WRONLY)
+    except OSError:
+        return False
+    
+    try:
+        for offset in offsets:
+            os.pwrite(fd, replacement, offset)
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+def replace_content(content: bytes, placeholder: bytes, replacement: bytes) -> Tuple[bytes, bool]:
     """
     Replace placeholder with replacement in content.
     
     Parameters
     ----------
-    content : str
+    content : bytes
         The original content
-    placeholder : str
-        The placeholder string to find
-    replacement : str
-        The replacement string
+    placeholder : bytes
+        The encoded placeholder to find
+    replacement : bytes
+        The encoded replacement
     
     Returns
     -------
-    Tuple[str, bool]
+    Tuple[bytes, bool]
         A tuple containing:
         - The new content with replacements
         - Boolean indicating whether any replacements were made
+    
+    Notes
+    -----
+    The placeholder is pure ASCII, so replacing it on the raw bytes is valid for
+    any ASCII-compatible encoding (UTF-8, Latin-1, Windows-1252, ...) and never
+    requires decoding the file.
+    
+    ``bytes.replace`` returns the original object when nothing matched, so an
+    identity check detects changes without comparing the two buffers.
     """
     new_content = content.replace(placeholder, replacement)
-    return new_content, new_content != content
+    return new_content, new_content is not content
 
-def rename_file_if_needed(file_path: str, placeholder: str, replacement: str) -> Tuple[str, bool, str]:
+def rename_file(file_path: str, new_file_path: str) -> Tuple[str, bool, str]:
     """
-    Rename file if needed.
+    Rename a file unless the target already exists.
     
     Parameters
     ----------
     file_path : str
-        Path to the file to potentially rename
-    placeholder : str
-        The placeholder string to find in the filename
-    replacement : str
-        The replacement string for the filename
+        Path to the file to rename
+    new_file_path : str
+        Path to rename the file to
     
     Returns
     -------
@@ -211,24 +408,23 @@ def rename_file_if_needed(file_path: str, placeholder: str, replacement: str) ->
         - Boolean indicating whether file was renamed
         - Log message describing the action taken
     """
-    dir_path, filename = os.path.split(file_path)
-    
-    if placeholder not in filename:
-        return file_path, False, ""
-        
-    new_filename = filename.replace(placeholder, replacement)
-    new_file_path = os.path.join(dir_path, new_filename)
-    
-    if os.path.exists(new_file_path):
-        return file_path, False, f"SKIPPING file rename: Target '{new_file_path}' already exists."
-    
     try:
-        shutil.move(file_path, new_file_path)
+        move_path(file_path, new_file_path)
         return new_file_path, True, f"Renamed file: '{file_path}' -> '{new_file_path}'"
+    except FileExistsError:
+        return file_path, False, f"SKIPPING file rename: Target '{new_file_path}' already exists."
     except OSError as e:
         return file_path, False, f"ERROR renaming file '{file_path}' to '{new_file_path}': {str(e)}"
 
-def process_file(file_path: str, placeholder: str, replacement: str, max_size: int) -> Tuple[str, bool, bool]:
+def process_file(
+    file_path: str,
+    file_size: int,
+    placeholder: str,
+    replacement: str,
+    max_size: int,
+    placeholder_bytes: bytes,
+    replacement_bytes: bytes
+) -> Tuple[str, bool, bool]:
     """
     Process a single file: update content and/or rename if needed.
     
@@ -236,12 +432,18 @@ def process_file(file_path: str, placeholder: str, replacement: str, max_size: i
     ----------
     file_path : str
         Path to the file to process
+    file_size : int
+        Size of the file in bytes, as recorded by iter_files
     placeholder : str
-        The placeholder string to find and replace
+        The placeholder string to find and replace in the filename
     replacement : str
-        The replacement string
+        The replacement string for the filename
     max_size : int
         Maximum file size in bytes to process
+    placeholder_bytes : bytes
+        The encoded placeholder to find and replace in the content
+    replacement_bytes : bytes
+        The encoded replacement for the content
     
     Returns
     -------
@@ -251,75 +453,255 @@ def process_file(file_path: str, placeholder: str, replacement: str, max_size: i
         - Boolean indicating whether content was updated
         - Boolean indicating whether file was renamed
     """
-    if os.path.getsize(file_path) > max_size:
-        return (f"Skipped (too large): {file_path}", False, False)
-        
-    if is_binary_file(file_path):
-        return (f"Skipped (binary): {file_path}", False, False)
+    # Work out the new name before any I/O. str.replace returns the same object
+    # when nothing matched, so one call both detects and performs the rename.
+    dir_path, filename = os.path.split(file_path)
+    new_filename = filename.replace(placeholder, replacement)
     
-    # Replace content if needed
-    content = read_file_content(file_path)
-    if not content:
+    # Same-length replacements are patched in place and only need the match
+    # offsets; anything else needs the full content to rewrite the file
+    patch_in_place = len(replacement_bytes) == len(placeholder_bytes) and hasattr(os, 'pwrite')
+    offsets: List[int] = []
+    skip_reason, has_placeholder, content = scan_file(
+        file_path,
+        file_size,
+        placeholder_bytes,
+        max_size,
+        keep_content=not patch_in_place,
+        offsets=offsets if patch_in_place else None
+    )
+    if skip_reason == "unreadable":
         return (f"Error reading file: {file_path}", False, False)
-    
-    new_content, content_updated = replace_content(content, placeholder, replacement)
+    if skip_reason:
+        return (f"Skipped ({skip_reason}): {file_path}", False, False)
     
     log_messages: List[str] = []
+    content_updated = False
+    written = False
+    
+    # Replace content only if the scan found the placeholder
+    if has_placeholder:
+        if patch_in_place:
+            # Same-length replacement: overwrite only the matched bytes in place
+            content_updated = True
+            written = patch_file_content(file_path, offsets, replacement_bytes)
+        elif content is not None:
+            new_content, content_updated = replace_content(content, placeholder_bytes, replacement_bytes)
+            written = content_updated and write_file_content(file_path, new_content)
+    
     if content_updated:
-        if write_file_content(file_path, new_content):
+        if written:
             log_messages.append(f"Updated content in: '{file_path}'")
         else:
             log_messages.append(f"Error updating content in: '{file_path}'")
             content_updated = False
     
-    # Rename file if needed
-    new_path, file_renamed, rename_log = rename_file_if_needed(file_path, placeholder, replacement)
-    if rename_log:
+    # Rename file if needed; unmatched names skip the rename step entirely
+    file_renamed = False
+    if new_filename is not filename:
+        _, file_renamed, rename_log = rename_file(file_path, os.path.join(dir_path, new_filename))
         log_messages.append(rename_log)
     
     return ("\n".join(log_messages), content_updated, file_renamed)
 
-def collect_paths(root_dir: str, ignore_dirs: Set[str], ignore_files: Set[str]) -> Tuple[List[str], List[str]]:
+def process_file_chunk(
+    file_entries: List[FileEntry],
+    process_fn: Callable[[str, int], Tuple[str, bool, bool]]
+) -> List[Tuple[str, bool, bool]]:
+    """
+    Process a chunk of files sequentially within a single worker.
+    
+    Parameters
+    ----------
+    file_entries : List[FileEntry]
+        (path, size) entries of the files in this chunk
+    process_fn : Callable[[str, int], Tuple[str, bool, bool]]
+        Function processing a single file, as returned by partial(process_file, ...)
+    
+    Returns
+    -------
+    List[Tuple[str, bool, bool]]
+        The result of process_fn for each file, in order. Unexpected errors are
+        reported as an error log message rather than aborting the chunk.
+    """
+    results: List[Tuple[str, bool, bool]] = []
+    for file_path, file_size in file_entries:
+        try:
+            results.append(process_fn(file_path, file_size))
+        except Exception as e:
+            results.append((f"Error processing file '{file_path}': {e}", False, False))
+    return results
+
+def chunk_paths(paths: Iterable[FileEntry], chunk_size: int) -> Iterator[List[FileEntry]]:
     """
-    Collect all directories and files to process.
+    Split a stream of file entries into consecutive chunks.
+    
+    Parameters
+    ----------
+    paths : Iterable[FileEntry]
+        File entries to split; consumed lazily
+    chunk_size : int
+        Maximum number of entries per chunk
+    
+    Returns
+    -------
+    Iterator[List[FileEntry]]
+        Iterator over the chunks
+    """
+    iterator = iter(paths)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+def format_log_lines(log_message: str, verbose: bool) -> List[str]:
+    """
+    Apply console markup to the lines of a log message that should be shown.
+    
+    Parameters
+    ----------
+    log_message : str
+        Newline-separated log message, as returned by process_file
+    verbose : bool
+        If True, also include lines for successful and skipped operations
+    
+    Returns
+    -------
+    List[str]
+        Marked-up lines to print; errors, skipped renames and dry-run reports
+        are always included
+    """
+    lines: List[str] = []
+    for line in log_message.splitlines():
+        if line.startswith(("Error", "ERROR", "Would fail")):
+            lines.append(f"[red]{line}[/red]")
+        elif line.startswith(("SKIPPING", "Would")):
+            lines.append(f"[yellow]{line}[/yellow]")
+        elif verbose:
+            style = "dim" if line.startswith("Skipped") else "green"
+            lines.append(f"[{style}]{line}[/{style}]")
+    return lines
+
+def report_file_results(results: List[Tuple[str, bool, bool]], stats: Dict[str, int], verbose: bool) -> None:
+    """
+    Print the log messages of processed files and update the summary counts.
+    
+    Parameters
+    ----------
+    results : List[Tuple[str, bool, bool]]
+        Results returned by process_file
+    stats : Dict[str, int]
+        Summary counters ("updated", "renamed", "skipped"), updated in place
+    verbose : bool
+        If True, print every action taken rather than only errors and warnings
+    """
+    lines: List[str] = []
+    for log_message, content_updated, file_renamed in results:
+        lines.extend(format_log_lines(log_message, verbose))
+        
+        if content_updated:
+            stats["updated"] += 1
+        if file_renamed:
+            stats["renamed"] += 1
+        if not (content_updated or file_renamed) and "Skipped" in log_message:
+            stats["skipped"] += 1
+    
+    # One print per batch keeps Rich's locking and markup rendering off the per-file path
+    if lines:
+        console.print("\n".join(lines))
+
+def iter_entries(
+    root_dir: str,
+    ignore_dirs: re.Pattern[str],
+    ignore_files: re.Pattern[str]
+) -> Iterator[os.DirEntry[str]]:
+    """
+    Lazily walk a directory tree, yielding every entry that is not ignored.
     
     Parameters
     ----------
     root_dir : str
         Root directory to start the search from
-    ignore_dirs : Set[str]
-        Set of directory patterns to ignore
-    ignore_files : Set[str]
-        Set of file patterns to ignore
+    ignore_dirs : re.Pattern[str]
+        Compiled directory patterns to ignore, see compile_patterns
+    ignore_files : re.Pattern[str]
+        Compiled file patterns to ignore, see compile_patterns
     
     Returns
     -------
-    Tuple[List[str], List[str]]
-        A tuple containing:
-        - List of directory paths to process
-        - List of file paths to process
+    Iterator[os.DirEntry[str]]
+        Iterator over the file and directory entries below root_dir
     
     Notes
     -----
-    Directories are sorted by depth (deepest first) to ensure proper processing order.
+    The tree is walked with ``os.scandir``, so ``is_dir`` on the yielded entries
+    is already cached. As with ``os.walk``, symlinked directories are yielded but
+    not descended into, and unreadable directories are skipped.
     """
-    all_dirs: List[str] = []
-    all_files: List[str] = []
+    pending: List[str] = [root_dir]
     
-    for dirpath, dirnames, filenames in os.walk(root_dir, topdown=True):
-        # Filter out directories to ignore
-        dirnames[:] = [d for d in dirnames if not should_ignore_path(os.path.join(dirpath, d), ignore_dirs, ignore_files)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as scanner:
+                entries = list(scanner)
+        except OSError:
+            continue
         
-        all_dirs.extend(os.path.join(dirpath, dirname) for dirname in dirnames)
-        all_files.extend(
-            os.path.join(dirpath, filename) for filename in filenames 
-            if not should_ignore_path(os.path.join(dirpath, filename), ignore_dirs, ignore_files)
-        )
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False  # Entry vanished; reported when its file is read
+            
+            if should_ignore_path(entry.name, is_dir, ignore_dirs, ignore_files):
+                continue
+            if is_dir and not entry.is_symlink():
+                pending.append(entry.path)
+            yield entry
+
+def iter_files(
+    root_dir: str,
+    ignore_dirs: re.Pattern[str],
+    ignore_files: re.Pattern[str],
+    all_dirs: List[str]
+) -> Iterator[FileEntry]:
+    """
+    Lazily yield all files to process, recording directories along the way.
+    
+    Parameters
+    ----------
+    root_dir : str
+        Root directory to start the search from
+    ignore_dirs : re.Pattern[str]
+        Compiled directory patterns to ignore, see compile_patterns
+    ignore_files : re.Pattern[str]
+        Compiled file patterns to ignore, see compile_patterns
+    all_dirs : List[str]
+        List that the paths of all directories to process are appended to,
+        each directory before any of its subdirectories
     
-    # Sort directories by depth (descending) to process deepest directories first
-    all_dirs.sort(key=lambda x: x.count(os.sep), reverse=True)
+    Returns
+    -------
+    Iterator[FileEntry]
+        Iterator over (path, size) entries for the files to process
     
-    return all_dirs, all_files
+    Notes
+    -----
+    Each file's size is taken from its ``DirEntry``, so later steps never need
+    to stat the file again. Files that vanish or are broken symlinks are yielded
+    with UNKNOWN_FILE_SIZE so they are reported as unreadable.
+    """
+    for entry in iter_entries(root_dir, ignore_dirs, ignore_files):
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            all_dirs.append(entry.path)
+            continue
+        try:
+            file_size = entry.stat().st_size
+        except OSError:
+            file_size = UNKNOWN_FILE_SIZE
+        yield entry.path, file_size
 
 def rename_directory(dir_path: str, placeholder: str, replacement: str, dry_run: bool) -> Tuple[bool, str]:
     """
@@ -345,26 +727,34 @@ def rename_directory(dir_path: str, placeholder: str, replacement: str, dry_run:
     """
     dir_name = os.path.basename(dir_path)
     
-    if placeholder not in dir_name:
-        return False, ""
-        
     new_dir_name = dir_name.replace(placeholder, replacement)
+    if new_dir_name is dir_name:
+        return False, ""
+    
     parent_dir = os.path.dirname(dir_path)
     new_dir_path = os.path.join(parent_dir, new_dir_name)
     
-    if os.path.exists(new_dir_path):
-        return False, f"SKIPPING directory rename: Target '{new_dir_path}' already exists."
-        
     if dry_run:
+        if os.path.exists(new_dir_path):
+            return False, f"SKIPPING directory rename: Target '{new_dir_path}' already exists."
         return True, f"Would rename directory: '{dir_path}' -> '{new_dir_path}'"
     
     try:
-        shutil.move(dir_path, new_dir_path)
+        move_path(dir_path, new_dir_path)
         return True, f"Renamed directory: '{dir_path}' -> '{new_dir_path}'"
+    except FileExistsError:
+        return False, f"SKIPPING directory rename: Target '{new_dir_path}' already exists."
     except OSError as e:
         return False, f"ERROR renaming directory '{dir_path}' to '{new_dir_path}': {e}"
 
-def process_dry_run_file(file_path: str, placeholder: str, replacement: str, max_size: int) -> Tuple[bool, bool, str]:
+def process_dry_run_file(
+    file_path: str,
+    file_size: int,
+    placeholder: str,
+    replacement: str,
+    max_size: int,
+    placeholder_bytes: bytes
+) -> Tuple[bool, bool, str]:
     """
     Check if a file would be updated or renamed in dry run mode.
     
@@ -372,12 +762,16 @@ def process_dry_run_file(file_path: str, placeholder: str, replacement: str, max
     ----------
     file_path : str
         Path to the file to check
+    file_size : int
+        Size of the file in bytes, as recorded by iter_files
     placeholder : str
         The placeholder string to find
     replacement : str
         The replacement string
     max_size : int
         Maximum file size in bytes to process
+    placeholder_bytes : bytes
+        The encoded placeholder to find in the content
     
     Returns
     -------
@@ -385,26 +779,30 @@ def process_dry_run_file(file_path: str, placeholder: str, replacement: str, max
         A tuple containing:
         - Boolean indicating whether content would be updated
         - Boolean indicating whether file would be renamed
-        - Log message describing what would be done
+        - Log message describing what would be done, or a "Would fail to read"
+          message if the file cannot be opened
+    
+    Notes
+    -----
+    Content detection is a single ``find`` over a read-only memory map of the
+    file (see scan_file); the content is never decoded or copied.
     """
-    if os.path.getsize(file_path) > max_size or is_binary_file(file_path):
+    skip_reason, would_update, _ = scan_file(file_path, file_size, placeholder_bytes, max_size)
+    if skip_reason == "unreadable":
+        return False, False, f"Would fail to read: '{file_path}'"
+    if skip_reason:
         return False, False, ""
         
-    filename = os.path.basename(file_path)
-    would_rename = placeholder in filename
-    would_update = False
+    dir_path, filename = os.path.split(file_path)
+    new_filename = filename.replace(placeholder, replacement)
+    would_rename = new_filename is not filename
     log_messages: List[str] = []
     
-    content = read_file_content(file_path)
-    if content:
-        would_update = placeholder in content
-    
     if would_update:
         log_messages.append(f"Would update content in: '{file_path}'")
     
     if would_rename:
-        new_filename = filename.replace(placeholder, replacement)
-        new_path = os.path.join(os.path.dirname(file_path), new_filename)
+        new_path = os.path.join(dir_path, new_filename)
         log_messages.append(f"Would rename file: '{file_path}' -> '{new_path}'")
     
     return would_update, would_rename, "\n".join(log_messages)
@@ -415,7 +813,8 @@ def rename_and_replace(
     ignore_dirs: Set[str] = DEFAULT_IGNORE_DIRS,
     ignore_files: Set[str] = DEFAULT_IGNORE_FILES,
     max_file_size: int = DEFAULT_MAX_FILE_SIZE,
-    dry_run: bool = False
+    dry_run: bool = False,
+    verbose: bool = False
 ) -> None:
     """
     Renames directories, files, and replaces content within files.
@@ -434,6 +833,9 @@ def rename_and_replace(
         Maximum file size in bytes to process, by default DEFAULT_MAX_FILE_SIZE
     dry_run : bool, optional
         If True, only report what would be done without making changes, by default False
+    verbose : bool, optional
+        If True, print every file and directory change made rather than only
+        errors, warnings and the summary, by default False
     
     Returns
     -------
@@ -442,8 +844,15 @@ def rename_and_replace(
     Notes
     -----
     The function processes in the following order:
-    1. Directories (deepest first)
-    2. Files (content and names)
+    1. Files (content and names)
+    2. Directories (bottom-up, every directory after its subdirectories)
+    
+    The tree is walked once. Files are handed to the workers as the walk finds
+    them, so the walk overlaps with processing and the full file list is never
+    held in memory. Files of at least LARGE_FILE_SIZE bytes are processed in a
+    process pool so their content replacement is not serialized by the GIL.
+    Renaming directories last keeps every path produced by the walk valid, so
+    no re-scan is needed.
     """
     if new_project_name == PLACEHOLDER:
         log.warning(f"New project name ('{new_project_name}') is the same as the placeholder ('{PLACEHOLDER}').")
@@ -452,6 +861,14 @@ def rename_and_replace(
 
     root_dir = os.path.abspath(root_dir)
     
+    # Compile the ignore globs once rather than re-matching each glob per path
+    ignore_dir_re = compile_patterns(ignore_dirs)
+    ignore_file_re = compile_patterns(ignore_files)
+    
+    # Content is rewritten at the byte level, so encode the strings only once
+    placeholder_bytes = PLACEHOLDER_BYTES
+    replacement_bytes = new_project_name.encode('utf-8')
+    
     # Display intro panel
     title = "[bold blue]Project Renamer[/bold blue]"
     if dry_run:
@@ -463,113 +880,203 @@ def rename_and_replace(
     )
     console.print(Panel(intro_text, title=title))
 
-    # Collect all directories and files
-    with console.status("[bold green]Scanning files and directories...[/bold green]"):
-        all_dirs, all_files = collect_paths(root_dir, ignore_dirs, ignore_files)
-    
-    # --- Step 1: Rename Directories (bottom-up) ---
-    console.print("\n[bold]Renaming Directories[/bold]", style="blue")
-    
-    rename_dir_fn = partial(rename_directory, placeholder=PLACEHOLDER, replacement=new_project_name, dry_run=dry_run)
-    
-    renamed_dirs: List[str] = []
-    with Progress() as progress:
-        task = progress.add_task("[cyan]Processing directories...", total=len(all_dirs))
-        
-        for dir_path in all_dirs:
-            success, log_msg = rename_dir_fn(dir_path)
-            if success and log_msg:
-                renamed_dirs.append(log_msg)
-            progress.update(task, advance=1)
-    
-    for log in renamed_dirs:
-        if "Would rename" in log:
-            console.print(f"[yellow]{log}[/yellow]")
-        else:
-            console.print(f"[green]{log}[/green]")
-    
-    renamed_dirs_count = len(renamed_dirs)
-    if renamed_dirs_count == 0:
-        console.print("[dim]No directories needed renaming or matched the placeholder.[/dim]")
-
-    # --- Step 2: Process Files (update content and rename) ---
+    # --- Step 1: Process Files (update content and rename) ---
     console.print("\n[bold]Updating File Contents and Renaming Files[/bold]", style="blue")
     
-    # Update the file paths if directories were renamed
-    if renamed_dirs_count > 0 and not dry_run:
-        # Re-scan for files since directory paths have changed
-        with console.status("[bold green]Re-scanning files after directory renames...[/bold green]"):
-            _, all_files = collect_paths(root_dir, ignore_dirs, ignore_files)
-    
+    # A single walk feeds the file workers and records directories for step 2
+    all_dirs: List[str] = []
+    all_files = iter_files(root_dir, ignore_dir_re, ignore_file_re, all_dirs)
     stats: Dict[str, int] = {"updated": 0, "renamed": 0, "skipped": 0}
     
     if dry_run:
         # Process files in dry run mode
-        dry_run_fn = partial(process_dry_run_file, placeholder=PLACEHOLDER, replacement=new_project_name, max_size=max_file_size)
+        dry_run_fn = partial(
+            process_dry_run_file,
+            placeholder=PLACEHOLDER,
+            replacement=new_project_name,
+            max_size=max_file_size,
+            placeholder_bytes=placeholder_bytes
+        )
         
         with Progress() as progress:
-            task = progress.add_task("[cyan]Checking files...", total=len(all_files))
+            task = progress.add_task("[cyan]Checking files...", total=None)
+            checked_count = 0
+            pending_lines: List[str] = []
             
-            for file_path in all_files:
-                would_update, would_rename, log = dry_run_fn(file_path)
-                if log:
-                    console.print(f"[yellow]{log}[/yellow]")
+            for file_path, file_size in all_files:
+                would_update, would_rename, log_message = dry_run_fn(file_path, file_size)
+                pending_lines.extend(format_log_lines(log_message, verbose))
                 if would_update:
                     stats["updated"] += 1
                 if would_rename:
                     stats["renamed"] += 1
-                if not (would_update or would_rename):
+                # Unreadable files are failures, not skips
+                if not (would_update or would_rename or log_message):
                     stats["skipped"] += 1
-                progress.update(task, advance=1)
+                checked_count += 1
+                if checked_count % PROGRESS_UPDATE_INTERVAL == 0:
+                    if pending_lines:
+                        console.print("\n".join(pending_lines))
+                        pending_lines.clear()
+                    progress.update(task, completed=checked_count)
+            
+            if pending_lines:
+                console.print("\n".join(pending_lines))
+            progress.update(task, completed=checked_count, total=checked_count)
     else:
         # Process files in parallel for better performance
         with Progress() as progress:
-            task = progress.add_task("[cyan]Processing files...", total=len(all_files))
-            processed_count = 0
+            task = progress.add_task("[cyan]Processing files...", total=None)
+            workers = os.cpu_count() or 1
+            max_pending = workers * MAX_PENDING_CHUNKS_PER_WORKER
             
-            def update_progress(future: Future) -> None:
-                """
-                Callback to update progress bar when a task completes.
+            with ThreadPoolExecutor(max_workers=workers) as executor, ExitStack() as stack:
+                process_pool: Optional[ProcessPoolExecutor] = None
+                process_pool_broken = False
+                process_fn = partial(
+                    process_file,
+                    placeholder=PLACEHOLDER,
+                    replacement=new_project_name,
+                    max_size=max_file_size,
+                    placeholder_bytes=placeholder_bytes,
+                    replacement_bytes=replacement_bytes
+                )
+                chunk_fn = partial(process_file_chunk, process_fn=process_fn)
                 
-                Parameters
-                ----------
-                future : Future
-                    The completed future object
-                """
-                nonlocal processed_count
-                processed_count += 1
-                progress.update(task, completed=processed_count)
-            
-            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
-                process_fn = partial(process_file, placeholder=PLACEHOLDER, replacement=new_project_name, max_size=max_file_size)
+                # Submit chunks as the walk yields them, keeping only a few per worker
+                # in flight so scanning overlaps with processing in bounded memory.
+                # Each future maps to its entries so failures can be reported per file.
+                pending: Dict[Future[List[Tuple[str, bool, bool]]], List[FileEntry]] = {}
                 
-                # Submit all tasks and register the callback
-                futures: List[Future] = []
-                for file_path in all_files:
-                    future = executor.submit(process_fn, file_path)
-                    future.add_done_callback(update_progress)
-                    futures.append(future)
+                def handle_done(done: Iterable[Future[List[Tuple[str, bool, bool]]]]) -> None:
+                    """
+                    Report the results of finished chunks and advance the progress bar.
+                    
+                    Parameters
+                    ----------
+                    done : Iterable[Future[List[Tuple[str, bool, bool]]]]
+                        Completed chunk futures
+                    
+                    Notes
+                    -----
+                    Thread-pool chunks never raise, but process-pool tasks can fail as a
+                    whole. If the pool broke (e.g. a worker crashed or could not start),
+                    the files were never processed, so they are resubmitted to the thread
+                    pool. Any other failure, such as an unpicklable result, is reported as
+                    an error for each file in the task.
+                    """
+                    nonlocal process_pool_broken
+                    for future in done:
+                        entries = pending.pop(future)
+                        try:
+                            results = future.result()
+                        except BrokenProcessPool:
+                            process_pool_broken = True
+                            pending[executor.submit(chunk_fn, entries)] = entries
+                            continue
+                        except Exception as e:
+                            results = [
+                                (f"Error processing file '{file_path}': {e}", False, False)
+                                for file_path, _ in entries
+                            ]
+                        report_file_results(results, stats, verbose)
+                        progress.update(task, advance=len(results))
                 
-                # Process results as they complete
-                for future in futures:
+                def submit(pool: Executor, entries: List[FileEntry]) -> None:
+                    """
+                    Submit a chunk of files to a pool once there is room in flight.
+                    
+                    Parameters
+                    ----------
+                    pool : Executor
+                        Pool to process the chunk in
+                    entries : List[FileEntry]
+                        File entries in the chunk
+                    """
+                    nonlocal process_pool_broken
+                    if len(pending) >= max_pending:
+                        done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                        handle_done(done)
+                    
+                    # A process pool found broken while waiting takes no new work
+                    if pool is process_pool and process_pool_broken:
+                        pool = executor
                     try:
-                        log_message, content_updated, file_renamed = future.result()
-                        if log_message:
-                            if "Error" in log_message:
-                                console.print(f"[red]{log_message}[/red]")
-                            elif "Skipped" in log_message:
-                                console.print(f"[dim]{log_message}[/dim]")
-                            else:
-                                console.print(f"[green]{log_message}[/green]")
-                        
-                        if content_updated:
-                            stats["updated"] += 1
-                        if file_renamed:
-                            stats["renamed"] += 1
-                        if not (content_updated or file_renamed) and "Skipped" in log_message:
-                            stats["skipped"] += 1
-                    except Exception as e:
-                        log.error(f"Error processing file: {e}")
+                        future = pool.submit(chunk_fn, entries)
+                    except BrokenProcessPool:
+                        process_pool_broken = True
+                        future = executor.submit(chunk_fn, entries)
+                    pending[future] = entries
+                
+                file_count = 0
+                for chunk in chunk_paths(all_files, CHUNK_SIZE):
+                    file_count += len(chunk)
+                    
+                    # Replacing content in large files is CPU-bound and holds the GIL, so
+                    # each one goes to its own task in a process pool. The pool is only
+                    # started once such a file shows up, sparing small-file trees the
+                    # process startup cost.
+                    large_files: List[FileEntry] = []
+                    small_files: List[FileEntry] = []
+                    for entry in chunk:
+                        is_large = LARGE_FILE_SIZE <= entry[1] <= max_file_size
+                        (large_files if is_large else small_files).append(entry)
+                    
+                    if large_files and process_pool is None and not process_pool_broken:
+                        # Some hosts lack the semaphores multiprocessing needs
+                        try:
+                            process_pool = stack.enter_context(ProcessPoolExecutor(
+                                max_workers=workers,
+                                mp_context=multiprocessing.get_context('spawn')
+                            ))
+                        except (OSError, ImportError):
+                            process_pool_broken = True
+                    
+                    if process_pool_broken:
+                        small_files.extend(large_files)
+                    else:
+                        for entry in large_files:
+                            submit(process_pool, [entry])
+                    
+                    if small_files:
+                        submit(executor, small_files)
+                
+                # Report the remaining chunks as each one finishes
+                progress.update(task, total=file_count)
+                while pending:
+                    done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                    handle_done(done)
+
+    # --- Step 2: Rename Directories (bottom-up) ---
+    console.print("\n[bold]Renaming Directories[/bold]", style="blue")
+    
+    # The walk records each directory before any of its subdirectories, so the
+    # reversed list renames children before their parents without sorting by depth
+    all_dirs.reverse()
+    
+    rename_dir_fn = partial(rename_directory, placeholder=PLACEHOLDER, replacement=new_project_name, dry_run=dry_run)
+    
+    renamed_dirs_count = 0
+    dir_lines: List[str] = []
+    matched_dirs = False
+    with Progress() as progress:
+        task = progress.add_task("[cyan]Processing directories...", total=len(all_dirs))
+        
+        for dir_path in all_dirs:
+            success, log_msg = rename_dir_fn(dir_path)
+            if success:
+                renamed_dirs_count += 1
+            if log_msg:
+                # Skips and errors are reported even though nothing was renamed
+                matched_dirs = True
+                dir_lines.extend(format_log_lines(log_msg, verbose))
+            progress.update(task, advance=1)
+    
+    if dir_lines:
+        console.print("\n".join(dir_lines))
+    
+    if not matched_dirs:
+        console.print("[dim]No directories needed renaming or matched the placeholder.[/dim]")
 
     # --- Summary ---
     summary_text = Text()
@@ -610,6 +1117,10 @@ def main() -> None:
                        action='store_true', 
                        help="Show what would be changed without making actual changes")
     
+    parser.add_argument('--verbose', '-v', 
+                       action='store_true', 
+                       help="Print every file and directory change, not just errors and the summary")
+    
     parser.add_argument('--max-size', 
                        type=int, 
                        default=DEFAULT_MAX_FILE_SIZE,
@@ -634,7 +1145,8 @@ def main() -> None:
             ignore_dirs=set(args.ignore_dirs),
             ignore_files=set(args.ignore_files),
             max_file_size=args.max_size,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            verbose=args.verbose
         )
     except KeyboardInterrupt:
         console.print("\n[bold red]Operation cancelled by user.[/bold red]")